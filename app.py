@@ -1,16 +1,15 @@
 """Hauptanwendung für die DIN EN 12831 Heizlastberechnung."""
 
-import json
-
 import streamlit as st
 
-from src.models import Building
-from src.ui.tab_catalog import render_catalog_tab
-from src.ui.tab_debug import render_debug_tab
-from src.ui.tab_report import render_report_tab
-from src.ui.tab_rooms import render_rooms_tab
-from src.ui.tab_temperatures import render_temperatures_tab
-from src.utils import load_building, save_building
+from src.utils import (
+    flush_building,
+    invalidate_catalog_index,
+    load_building,
+    load_uploaded_building,
+    mark_building_dirty,
+    save_building,
+)
 
 st.set_page_config(page_title="DIN EN 12831 Heizlast", layout="wide")
 
@@ -32,10 +31,12 @@ def render_sidebar() -> None:
             "Gebäudedaten laden", type=["json"], help="Wähle eine building_data*.json Datei zum Laden"
         )
 
-        if uploaded_file is not None:
+        # Jede hochgeladene Datei nur einmal übernehmen, nicht bei jedem Rerun erneut
+        if uploaded_file is not None and st.session_state.get("_uploaded_file_id") != uploaded_file.file_id:
             try:
-                data = json.load(uploaded_file)
-                st.session_state.building = Building.model_validate(data)
+                st.session_state.building = load_uploaded_building(uploaded_file)
+                st.session_state["_uploaded_file_id"] = uploaded_file.file_id
+                invalidate_catalog_index()
                 st.success(f"✅ Datei '{uploaded_file.name}' erfolgreich geladen!")
                 # Speichere das geladene Gebäude direkt
                 save_building(st.session_state.building)
@@ -49,7 +50,7 @@ def render_sidebar() -> None:
         # Wenn sich der Name ändert, speichere unter neuem Dateinamen
         if building_name != st.session_state.building.name:
             st.session_state.building.name = building_name
-            save_building(st.session_state.building)
+            mark_building_dirty()
 
         thermal_bridge_surcharge = st.number_input(
             "Wärmebrückenzuschlag",
@@ -62,7 +63,7 @@ def render_sidebar() -> None:
 
         if thermal_bridge_surcharge != st.session_state.building.thermal_bridge_surcharge:
             st.session_state.building.thermal_bridge_surcharge = thermal_bridge_surcharge
-            save_building(st.session_state.building)
+            mark_building_dirty()
 
         st.divider()
         st.subheader("Gebäudeübersicht")
@@ -80,23 +81,38 @@ def main() -> None:
 
     render_sidebar()
 
+    # Tab-Module erst hier importieren, damit Titel und Sidebar bereits vor dem Laden
+    # von pandas & Co. an den Browser gesendet werden
     tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 Report", "📐 Räume", "🏗️ Bauteilkatalog", "🌡️ Temperaturen", "🔍 Debug"])
 
     with tab1:
+        from src.ui.tab_report import render_report_tab
+
         render_report_tab()
 
     with tab2:
+        from src.ui.tab_rooms import render_rooms_tab
+
         render_rooms_tab()
 
     with tab3:
+        from src.ui.tab_catalog import render_catalog_tab
+
         render_catalog_tab()
 
     with tab4:
+        from src.ui.tab_temperatures import render_temperatures_tab
+
         render_temperatures_tab()
 
     with tab5:
+        from src.ui.tab_debug import render_debug_tab
+
         render_debug_tab()
 
+    # Gesammelte Änderungen aus der Sidebar einmalig speichern
+    flush_building()
+
 
 if __name__ == "__main__":
     main()
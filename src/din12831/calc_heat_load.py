@@ -1,11 +1,19 @@
+"""Heizlastberechnung nach DIN EN 12831.
+
+Die Funktionen lesen das Gebäudemodell nur und erzeugen keine Modellobjekte: validiert wird einmal beim
+Laden bzw. Bearbeiten. Wer für Parameterstudien veränderte Kopien von Building/Room/Wall anlegt, sollte
+bereits geprüfte Daten mit model_construct statt über den Konstruktor (erneute Validierung) übernehmen.
+"""
+
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import chain
 
 from src.models import Building, ConstructionType, Room
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElementHeatLoad:
     """Wärmeverlust eines einzelnen Bauteils."""
 
@@ -17,16 +25,19 @@ class ElementHeatLoad:
     transmission_w: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoomHeatLoadResult:
     room_name: str
     element_transmissions: list[ElementHeatLoad]
     ventilation_w: float
+    # Gesamte Transmissionswärmeverluste, einmal beim Erzeugen summiert
+    transmission_w: float = field(init=False)
 
-    @property
-    def transmission_w(self) -> float:
-        """Gesamte Transmissionswärmeverluste."""
-        return sum(element.transmission_w for element in self.element_transmissions)
+    def __post_init__(self) -> None:
+        # frozen: Zuweisung nur über object.__setattr__ möglich
+        object.__setattr__(
+            self, "transmission_w", sum(element.transmission_w for element in self.element_transmissions)
+        )
 
     @property
     def total_w(self) -> float:
@@ -77,17 +88,19 @@ def calc_floor_ceiling_heat_load(
     """Berechnet die Transmissionswärmeverluste für Boden und Decke."""
     elements_list: list[ElementHeatLoad] = []
 
+    gross_area_m2 = room.gross_area_m2(building) if room.floor or room.ceiling else 0.0
+    delta_temp_outside = room_temp - outside_temperatur
+
     # Boden berechnen
     if room.floor:
-        # Brutto-Grundfläche des Bodens
-        floor_area = room.gross_floor_area_m2(building)
+        floor_area = gross_area_m2
 
         # Temperaturdifferenz für Boden
         if room.floor.adjacent_temperature_name:
             adj_temp = building.get_temperature_by_name(room.floor.adjacent_temperature_name)
             delta_temp_floor = room_temp - adj_temp.value_celsius
         else:
-            delta_temp_floor = room_temp - outside_temperatur
+            delta_temp_floor = delta_temp_outside
 
         elements_list.append(
             calc_element_transmission(
@@ -101,15 +114,14 @@ def calc_floor_ceiling_heat_load(
 
     # Decke berechnen
     if room.ceiling:
-        # Brutto-Grundfläche der Decke
-        ceiling_area = room.gross_ceiling_area_m2(building)
+        ceiling_area = gross_area_m2
 
         # Temperaturdifferenz für Decke
         if room.ceiling.adjacent_temperature_name:
             adj_temp = building.get_temperature_by_name(room.ceiling.adjacent_temperature_name)
             delta_temp_ceiling = room_temp - adj_temp.value_celsius
         else:
-            delta_temp_ceiling = room_temp - outside_temperatur
+            delta_temp_ceiling = delta_temp_outside
 
         elements_list.append(
             calc_element_transmission(
@@ -130,15 +142,20 @@ def calc_walls_heat_load(
     """Berechnet die Transmissionswärmeverluste für Wände (berücksichtigt Innenwände, Fenster und Türen)."""
     walls_list: list[ElementHeatLoad] = []
 
+    # Bruttohöhe und Temperaturdifferenz nach außen sind für alle Wände des Raums gleich
+    gross_height_m = room.gross_height_m(building)
+    delta_temp_outside = room_temp - outside_temperatur
+
     for wall in room.walls:
         # Hole Wall-Construction aus Katalog
         wall_construction = building.get_construction_by_name(wall.construction_name)
 
         # Berechne Bruttowandfläche
-        wall_area_m2 = wall.gross_length_m(building) * room.gross_height_m(building)
+        wall_area_m2 = wall.gross_length_m(building) * gross_height_m
 
-        # Berechne Abzugsfläche für Fenster und Türen
-        deduction_area = sum(window.area_m2 for window in wall.windows) + sum(door.area_m2 for door in wall.doors)
+        # Fenster und Türen einmal auflösen: Fläche dient als Abzug und als eigenes Bauteil
+        openings = [(opening, opening.area_m2) for opening in chain(wall.windows, wall.doors)]
+        deduction_area = sum(opening_area_m2 for _, opening_area_m2 in openings)
 
         # Bestimme Temperaturdifferenz basierend auf Wandtyp
         if wall_construction.element_type == ConstructionType.INTERNAL_WALL:
@@ -147,7 +164,7 @@ def calc_walls_heat_load(
             delta_temp = room_temp - adjacent_room_temperature.value_celsius
         else:
             # Bei Außenwänden: Verwende Außentemperatur
-            delta_temp = room_temp - outside_temperatur
+            delta_temp = delta_temp_outside
 
         walls_list.append(
             calc_element_transmission(
@@ -160,26 +177,14 @@ def calc_walls_heat_load(
             )
         )
 
-        # Fenster in dieser Wand
-        for window in wall.windows:
+        # Fenster und Türen in dieser Wand
+        for opening, opening_area_m2 in openings:
             walls_list.append(
                 calc_element_transmission(
                     building,
-                    f"{window.name} ({wall.orientation})",
-                    window.construction_name,
-                    window.area_m2,
-                    delta_temp,
-                )
-            )
-
-        # Türen in dieser Wand
-        for door in wall.doors:
-            walls_list.append(
-                calc_element_transmission(
-                    building,
-                    f"{door.name} ({wall.orientation})",
-                    door.construction_name,
-                    door.area_m2,
+                    f"{opening.name} ({wall.orientation})",
+                    opening.construction_name,
+                    opening_area_m2,
                     delta_temp,
                 )
             )
@@ -189,11 +194,11 @@ def calc_walls_heat_load(
 
 def calc_transmission_heat_load(room: Room, room_temp: float, outside_temperatur: float, building: Building) -> float:
     """Berechnet die Transmissionswärmeverluste eines Raums."""
-    floor_ceiling_list = calc_floor_ceiling_heat_load(room, room_temp, outside_temperatur, building)
-    walls_list = calc_walls_heat_load(room, room_temp, outside_temperatur, building)
-    floor_ceiling_heat_load = sum(e.transmission_w for e in floor_ceiling_list)
-    walls_heat_load = sum(w.transmission_w for w in walls_list)
-    return floor_ceiling_heat_load + walls_heat_load
+    elements = chain(
+        calc_floor_ceiling_heat_load(room, room_temp, outside_temperatur, building),
+        calc_walls_heat_load(room, room_temp, outside_temperatur, building),
+    )
+    return sum(element.transmission_w for element in elements)
 
 
 def calc_ventilation_heat_load(room: Room, room_temp: float, outside_temperatur: float) -> float:
@@ -232,4 +237,49 @@ def calc_room_heat_load(room: Room, outside_temperatur: float, building: Buildin
 
 
 def calc_building_heat_load(building: Building) -> list[RoomHeatLoadResult]:
-    return [calc_room_heat_load(room, building.outside_temperature.value_celsius, building) for room in building.rooms]
+    # Außentemperatur einmal für alle Räume nachschlagen
+    outside_temperatur = building.outside_temperature.value_celsius
+    return [calc_room_heat_load(room, outside_temperatur, building) for room in building.rooms]
+
+
+@dataclass(frozen=True)
+class HeatLoadSweep:
+    """Heizlast je Raum als lineare Funktion der Außentemperatur.
+
+    Transmission nach außen und Lüftung hängen linear von der Außentemperatur ab, Innenbauteile gar nicht.
+    Daher gilt je Raum: Q(θe) = reference_w + slope_w_k * (reference_temperatur - θe).
+    """
+
+    room_names: list[str]
+    reference_temperatur: float
+    reference_w: list[float]
+    slope_w_k: list[float]
+
+    def evaluate(self, outside_temperatur: float) -> list[float]:
+        """Gesamte Heizlast je Raum in W für eine beliebige Außentemperatur."""
+        delta_temp = self.reference_temperatur - outside_temperatur
+        return [q + slope * delta_temp for q, slope in zip(self.reference_w, self.slope_w_k, strict=True)]
+
+
+def compile_heat_load_sweep(building: Building) -> HeatLoadSweep:
+    """Bereitet Parameterstudien über die Außentemperatur vor.
+
+    Das Gebäude wird nur zweimal vollständig berechnet (bei Normaußentemperatur und 1 K darunter);
+    jede weitere Auswertung über HeatLoadSweep.evaluate kostet nur noch eine Rechnung pro Raum.
+
+    Args:
+        building: Building-Objekt mit Räumen und Katalogen
+
+    Returns:
+        HeatLoadSweep mit Heizlast und Steigung je Raum bezogen auf die Normaußentemperatur
+    """
+    reference_temperatur = building.outside_temperature.value_celsius
+    reference = calc_building_heat_load(building)
+    colder = [calc_room_heat_load(room, reference_temperatur - 1.0, building) for room in building.rooms]
+
+    return HeatLoadSweep(
+        room_names=[result.room_name for result in reference],
+        reference_temperatur=reference_temperatur,
+        reference_w=[result.total_w for result in reference],
+        slope_w_k=[cold.total_w - ref.total_w for cold, ref in zip(colder, reference, strict=True)],
+    )
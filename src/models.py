@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import ClassVar
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 # =============================================================================
 # Enumerations
@@ -21,6 +21,16 @@ class ConstructionType(str, Enum):
     DOOR = "door"
 
 
+# Anteil der Dicke, mit dem ein Bauteil an angrenzende Bauteile angerechnet wird.
+# Nur Typen mit Dicke sind enthalten; Außenwand voll, alle anderen zur Hälfte.
+_ADJACENT_THICKNESS_FACTOR: dict[ConstructionType, float] = {
+    ConstructionType.EXTERNAL_WALL: 1.0,
+    ConstructionType.INTERNAL_WALL: 0.5,
+    ConstructionType.FLOOR: 0.5,
+    ConstructionType.CEILING: 0.5,
+}
+
+
 class ElementType(str, Enum):
     """Elementtypen für konkrete Bauelemente in Räumen."""
 
@@ -49,6 +59,8 @@ class Ventilation(BaseModel):
     Definiert die Luftwechselrate für die Berechnung von Lüftungswärmeverlusten nach DIN 12831.
     """
 
+    model_config = ConfigDict(revalidate_instances="never", validate_assignment=False)
+
     air_change_1_h: float = Field(default=0.5, ge=0.0, description="Luftwechsel n in 1/h")
 
 
@@ -70,6 +82,52 @@ class Area(BaseModel):
         return self.length_m * self.width_m
 
 
+class _NameIndex:
+    """Nachschlage-Index Name -> Position für die Kataloge eines Gebäudes.
+
+    Der Index speichert Positionen statt Einträgen und prüft jeden Treffer gegen die aktuelle
+    Liste. Ersetzte, verschobene oder umbenannte Einträge lösen so einen Neuaufbau aus, statt
+    veraltete Objekte zu liefern. Nimmt nicht am Modellvergleich teil: zwei Indizes gelten immer als gleich.
+    """
+
+    __slots__ = ("_items", "_positions")
+
+    def __init__(self) -> None:
+        # Referenz statt id(): eine neue Liste kann nicht zufällig als die alte gelten
+        self._items: list[Any] | None = None
+        self._positions: dict[str, int] = {}
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _NameIndex)
+
+    def _rebuild(self, items: list[Any]) -> None:
+        positions: dict[str, int] = {}
+        for pos, item in enumerate(items):
+            # Bei doppelten Namen gewinnt wie bei der linearen Suche der erste Eintrag
+            positions.setdefault(item.name, pos)
+        self._positions = positions
+        self._items = items
+
+    def _get(self, items: list[Any], name: str) -> Any | None:
+        pos = self._positions.get(name)
+        if pos is None or pos >= len(items):
+            return None
+        item = items[pos]
+        return item if item.name == name else None
+
+    def lookup(self, items: list[Any], name: str) -> Any | None:
+        """Sucht einen Eintrag nach Name; gibt None zurück, wenn er nicht existiert."""
+        if items is not self._items:
+            self._rebuild(items)
+
+        item = self._get(items, name)
+        if item is None:
+            # Katalog wurde seit dem Aufbau verändert: Index einmalig neu aufbauen
+            self._rebuild(items)
+            item = self._get(items, name)
+        return item
+
+
 # =============================================================================
 # Fachliche Klassen
 # =============================================================================
@@ -83,6 +141,8 @@ class Construction(BaseModel):
     Enthält thermische Eigenschaften und Validierung für dickenabhängige Berechnungen.
     """
 
+    model_config = ConfigDict(revalidate_instances="never", validate_assignment=False)
+
     name: str
     element_type: ConstructionType = Field(default=ConstructionType.EXTERNAL_WALL, description="Bauteiltyp")
     u_value_w_m2k: float = Field(gt=0, description="U-Wert in W/(m²·K)")
@@ -114,19 +174,21 @@ class Construction(BaseModel):
         Raises:
             ValueError: Wenn Bauteiltyp keine Dickenberechnung unterstützt oder keine Dicke definiert ist
         """
-        if self.element_type not in Construction._TYPES_REQUIRING_THICKNESS:
+        # Felder nur einmal lesen: wird für jede Wand zweimal (linke/rechte Nachbarwand) aufgerufen
+        thickness_m = self.thickness_m
+
+        # Eine Tabellenabfrage ersetzt Typprüfung und Verzweigung Außenwand/sonstige
+        factor = _ADJACENT_THICKNESS_FACTOR.get(self.element_type)
+        if factor is None:
             raise ValueError(
                 f"Invalid construction type '{self.element_type.value}' for '{self.name}'. "
                 f"Only walls, floors, and ceilings have adjacent thickness."
             )
 
-        if self.thickness_m is None:
+        if thickness_m is None:
             raise ValueError(f"Construction '{self.name}' has no thickness defined")
 
-        if self.element_type == ConstructionType.EXTERNAL_WALL:
-            return self.thickness_m
-        else:
-            return self.thickness_m / 2.0
+        return thickness_m * factor
 
 
 class Element(BaseModel):
@@ -137,7 +199,7 @@ class Element(BaseModel):
     Fenster und Türen benötigen Breite und Höhe.
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(revalidate_instances="never", validate_assignment=False)
 
     type: ElementType
     name: str
@@ -172,7 +234,7 @@ class Wall(BaseModel):
     und Verknüpfungen zu angrenzenden Wänden für Brutto-Längenberechnungen.
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(revalidate_instances="never", validate_assignment=False)
 
     orientation: str = Field(description="Richtung/Bezeichnung (z.B. Nord, Ost, Süd 1, West 2)")
     net_length_m: float = Field(gt=0, description="Netto-Wandlänge (Innenraumlänge) in m")
@@ -217,9 +279,11 @@ class Room(BaseModel):
     Berechnet Netto- und Bruttoflächen/-volumina für die Wärmeverlustberechnung nach DIN 12831.
     """
 
+    model_config = ConfigDict(revalidate_instances="never", validate_assignment=False)
+
     name: str
     areas: list[Area] = Field(
-        default=[],
+        default_factory=list,
         description="Raumgrundriss als Summe mehrerer Rechtecke (jeweils Länge×Breite).",
     )
     net_height_m: float = Field(gt=0, description="Netto-Raumhöhe (Innenraumhöhe) in m")
@@ -302,6 +366,9 @@ class Room(BaseModel):
         # Nettofläche als Basis
         net_area = self.floor_area_m2
 
+        # Nachbarwand-Dicken je Konstruktionsname merken: dieselben Namen tauchen bei mehreren Wänden auf
+        neighbor_thickness: dict[str, float] = {}
+
         # Addiere Flächenstreifen für jede Wand
         for wall in self.walls:
             wall_construction = building.get_construction_by_name(wall.construction_name)
@@ -317,8 +384,14 @@ class Room(BaseModel):
                 effective_wall_thickness = wall_thickness
 
             # Berechne Dicken der Nachbarwände (volle Dicke bei Außenwänden, halbe bei Innenwänden)
-            left_thickness = self._get_neighbor_thickness(building, wall.left_wall_name)
-            right_thickness = self._get_neighbor_thickness(building, wall.right_wall_name)
+            left_thickness = neighbor_thickness.get(wall.left_wall_name)
+            if left_thickness is None:
+                left_thickness = self._get_neighbor_thickness(building, wall.left_wall_name)
+                neighbor_thickness[wall.left_wall_name] = left_thickness
+            right_thickness = neighbor_thickness.get(wall.right_wall_name)
+            if right_thickness is None:
+                right_thickness = self._get_neighbor_thickness(building, wall.right_wall_name)
+                neighbor_thickness[wall.right_wall_name] = right_thickness
 
             # Wandfläche: Mittelteil (mit effektiver Dicke) + halbe linke Ecke + halbe rechte Ecke
             # Eckflächen werden durch 2 geteilt, da jede Ecke von zwei Wänden geteilt wird
@@ -331,17 +404,21 @@ class Room(BaseModel):
 
         return net_area
 
+    def gross_area_m2(self, building: Building) -> float:
+        """Berechnet die Brutto-Grundfläche des Raums (für Boden und Decke identisch)."""
+        return self._calculate_gross_area_m2(building)
+
     def gross_floor_area_m2(self, building: Building) -> float:
         """Berechnet die Brutto-Grundfläche des Bodens."""
         if not self.floor:
             return 0.0
-        return self._calculate_gross_area_m2(building)
+        return self.gross_area_m2(building)
 
     def gross_ceiling_area_m2(self, building: Building) -> float:
         """Berechnet die Brutto-Grundfläche der Decke."""
         if not self.ceiling:
             return 0.0
-        return self._calculate_gross_area_m2(building)
+        return self.gross_area_m2(building)
 
     @property
     def volume_m3(self) -> float:
@@ -354,8 +431,13 @@ class Building(BaseModel):
     Zentrales Objekt für die Heizlastberechnung nach DIN 12831.
     Enthält Temperatur- und Konstruktionskataloge sowie alle Räume des Gebäudes.
     Verwaltet globale Parameter wie Wärmebrückenzuschlag.
+
+    Bereits validierte Modellinstanzen (Räume, Konstruktionen, ...) werden beim Zusammenbau
+    weder erneut validiert noch kopiert, sondern per Referenz übernommen.
     """
 
+    model_config = ConfigDict(revalidate_instances="never", validate_assignment=False)
+
     name: str
     temperature_catalog: list[Temperature] = Field(default_factory=list, description="Temperaturkatalog")
     outside_temperature_name: str | None = Field(default=None, description="Name der Normaußentemperatur aus Katalog")
@@ -366,23 +448,26 @@ class Building(BaseModel):
     thermal_bridge_surcharge: float = Field(default=0.05, ge=0, description="Wärmebrückenzuschlag (größer als 0)")
     rooms: list[Room] = Field(default_factory=list)
 
+    _temperature_index: _NameIndex = PrivateAttr(default_factory=_NameIndex)
+    _construction_index: _NameIndex = PrivateAttr(default_factory=_NameIndex)
+
     def get_temperature_by_name(self, name: str | None) -> Temperature:
         """Holt eine Temperatur aus dem Katalog nach Name."""
         if name is None:
             raise ValueError("Temperature name cannot be None")
-        for temp in self.temperature_catalog:
-            if temp.name == name:
-                return temp
-        raise ValueError(f"Temperature '{name}' not found in catalog")
+        temp = self._temperature_index.lookup(self.temperature_catalog, name)
+        if temp is None:
+            raise ValueError(f"Temperature '{name}' not found in catalog")
+        return temp
 
     def get_construction_by_name(self, name: str | None) -> Construction:
         """Holt ein Bauteil aus dem Katalog nach Name."""
         if name is None:
             raise ValueError("Construction name cannot be None")
-        for construction in self.construction_catalog:
-            if construction.name == name:
-                return construction
-        raise ValueError(f"Construction '{name}' not found in catalog")
+        construction = self._construction_index.lookup(self.construction_catalog, name)
+        if construction is None:
+            raise ValueError(f"Construction '{name}' not found in catalog")
+        return construction
 
     @property
     def outside_temperature(self) -> Temperature:
@@ -3,7 +3,60 @@
 import streamlit as st
 
 from src.models import Construction, ConstructionType
-from src.utils import save_building
+from src.utils import invalidate_catalog_index, mark_building_dirty, save_building
+
+_TYPE_LABELS: dict[ConstructionType, str] = {
+    ConstructionType.EXTERNAL_WALL: "Außenwand",
+    ConstructionType.INTERNAL_WALL: "Innenwand",
+    ConstructionType.CEILING: "Decke",
+    ConstructionType.FLOOR: "Boden",
+    ConstructionType.WINDOW: "Fenster",
+    ConstructionType.DOOR: "Tür",
+}
+
+_CONSTRUCTION_TYPE_OPTIONS: tuple[ConstructionType, ...] = tuple(ConstructionType)
+
+_DEFAULT_THICKNESS_M = 0.30
+
+_TYPES_WITH_THICKNESS: frozenset[ConstructionType] = frozenset(
+    {
+        ConstructionType.EXTERNAL_WALL,
+        ConstructionType.INTERNAL_WALL,
+        ConstructionType.CEILING,
+        ConstructionType.FLOOR,
+    }
+)
+
+
+def _add_construction() -> None:
+    """Übernimmt die Formulareingaben als neue Konstruktion in den Katalog.
+
+    Wird als on_click-Callback vor dem Rerun ausgeführt. Alle Tabs sehen den neuen Eintrag
+    daher bereits im selben Lauf, ein zusätzliches st.rerun() ist nicht nötig.
+    """
+    catalog_name = st.session_state.get("catalog_name", "")
+    if not catalog_name:
+        st.session_state["catalog_add_message"] = ("error", "Bitte geben Sie eine Bezeichnung ein.")
+        return
+
+    element_type = st.session_state["catalog_element_type"]
+    catalog_thickness = None
+    if element_type in _TYPES_WITH_THICKNESS:
+        catalog_thickness = st.session_state.get("catalog_thickness", _DEFAULT_THICKNESS_M)
+
+    new_construction = Construction(
+        name=catalog_name,
+        element_type=element_type,
+        u_value_w_m2k=st.session_state["catalog_u"],
+        thickness_m=catalog_thickness,
+    )
+    st.session_state.building.construction_catalog.append(new_construction)
+    invalidate_catalog_index()
+    save_building(st.session_state.building)
+
+    # Formular im folgenden Lauf zurücksetzen
+    st.session_state["reset_catalog_form"] = True
+    st.session_state["catalog_add_message"] = ("success", f"Konstruktion '{catalog_name}' wurde hinzugefügt!")
 
 
 def render_catalog_add_form() -> None:
@@ -14,8 +67,7 @@ def render_catalog_add_form() -> None:
         # Reset flag prüfen und Session State leeren
         if st.session_state.get("reset_catalog_form", False):
             for key in ["catalog_element_type", "catalog_name", "catalog_u", "catalog_thickness"]:
-                if key in st.session_state:
-                    del st.session_state[key]
+                st.session_state.pop(key, None)
             st.session_state["reset_catalog_form"] = False
 
         # Alle Eingaben in einer Zeile
@@ -24,54 +76,45 @@ def render_catalog_add_form() -> None:
         with cols[0]:
             element_type = st.selectbox(
                 "Bauteiltyp",
-                options=list(ConstructionType),
-                format_func=lambda x: {
-                    ConstructionType.EXTERNAL_WALL: "Außenwand",
-                    ConstructionType.INTERNAL_WALL: "Innenwand",
-                    ConstructionType.CEILING: "Decke",
-                    ConstructionType.FLOOR: "Boden",
-                    ConstructionType.WINDOW: "Fenster",
-                    ConstructionType.DOOR: "Tür",
-                }[x],
+                options=_CONSTRUCTION_TYPE_OPTIONS,
+                format_func=_TYPE_LABELS.__getitem__,
                 key="catalog_element_type",
             )
 
         with cols[1]:
-            catalog_name = st.text_input("Bezeichnung", placeholder="z.B. Außenwand gedämmt", key="catalog_name")
+            st.text_input("Bezeichnung", placeholder="z.B. Außenwand gedämmt", key="catalog_name")
 
         with cols[2]:
-            catalog_u = st.number_input("U-Wert (W/m²K)", min_value=0.01, value=0.24, step=0.01, key="catalog_u")
+            st.number_input("U-Wert (W/m²K)", min_value=0.01, value=0.24, step=0.01, key="catalog_u")
 
         # Dicke nur für Wand, Decke, Boden anzeigen
-        has_thickness = element_type in [
-            ConstructionType.EXTERNAL_WALL,
-            ConstructionType.INTERNAL_WALL,
-            ConstructionType.CEILING,
-            ConstructionType.FLOOR,
-        ]
-        catalog_thickness = None
+        has_thickness = element_type in _TYPES_WITH_THICKNESS
         if has_thickness:
             with cols[3]:
-                catalog_thickness = st.number_input(
-                    "Dicke (m)", min_value=0.00, value=0.30, step=0.01, key="catalog_thickness"
+                st.number_input(
+                    "Dicke (m)", min_value=0.00, value=_DEFAULT_THICKNESS_M, step=0.01, key="catalog_thickness"
                 )
 
-        if st.button("Konstruktion hinzufügen", type="primary", key="add_catalog"):
-            if not catalog_name:
-                st.error("Bitte geben Sie eine Bezeichnung ein.")
-                return
+        st.button("Konstruktion hinzufügen", type="primary", key="add_catalog", on_click=_add_construction)
+
+        message = st.session_state.pop("catalog_add_message", None)
+        if message:
+            kind, text = message
+            if kind == "error":
+                st.error(text)
+            else:
+                st.success(text)
 
-            new_construction = Construction(
-                name=catalog_name,
-                element_type=element_type,
-                u_value_w_m2k=catalog_u,
-                thickness_m=catalog_thickness,
-            )
-            st.session_state.building.construction_catalog.append(new_construction)
-            save_building(st.session_state.building)
 
-            st.success(f"Konstruktion '{catalog_name}' wurde hinzugefügt!")
-            st.rerun()
+def _delete_construction(idx: int) -> None:
+    """Entfernt eine Konstruktion aus dem Katalog.
+
+    Wird als on_click-Callback vor dem Rerun ausgeführt, daher ist kein zusätzliches
+    st.rerun() nötig. Gespeichert wird gesammelt am Ende des Laufs.
+    """
+    st.session_state.building.construction_catalog.pop(idx)
+    invalidate_catalog_index()
+    mark_building_dirty()
 
 
 def render_catalog_list() -> None:
@@ -84,32 +127,20 @@ def render_catalog_list() -> None:
 
     st.subheader(f"Vorhandene Konstruktionen ({len(catalog)})")
 
-    type_labels = {
-        ConstructionType.EXTERNAL_WALL: "Außenwand",
-        ConstructionType.INTERNAL_WALL: "Innenwand",
-        ConstructionType.CEILING: "Decke",
-        ConstructionType.FLOOR: "Boden",
-        ConstructionType.WINDOW: "Fenster",
-        ConstructionType.DOOR: "Tür",
-    }
-
     for idx, construction in enumerate(catalog):
         cols = st.columns([2, 1, 2, 2, 1])
 
         with cols[0]:
             st.write(f"**{construction.name}**")
         with cols[1]:
-            st.write(f"{type_labels[construction.element_type]}")
+            st.write(f"{_TYPE_LABELS[construction.element_type]}")
         with cols[2]:
             st.write(f"U: {construction.u_value_w_m2k:.3f} W/m²K")
         with cols[3]:
             thickness_text = f"{construction.thickness_m:.3f} m" if construction.thickness_m else "—"
             st.write(f"Dicke: {thickness_text}")
         with cols[4]:
-            if st.button("🗑️", key=f"delete_catalog_{idx}"):
-                catalog.pop(idx)
-                save_building(st.session_state.building)
-                st.rerun()
+            st.button("🗑️", key=f"delete_catalog_{idx}", on_click=_delete_construction, args=(idx,))
 
 
 def render_catalog_tab() -> None:
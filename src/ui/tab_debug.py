@@ -2,8 +2,10 @@
 
 import streamlit as st
 
+from src.utils import get_building_json
+
 
 def render_debug_tab() -> None:
     """Rendert den kompletten Debug-Tab."""
     st.header("Debug-Informationen")
-    st.json(st.session_state.building.model_dump())
+    st.json(get_building_json())
@@ -25,41 +25,61 @@ def _validate_building_data(building: Building) -> str | None:
     return None
 
 
-def _create_rooms_dataframe(results: list[RoomHeatLoadResult]) -> pd.DataFrame:
-    """Erstellt einen DataFrame mit allen Räumen und deren Heizlasten.
+def _results_to_columns(results: list[RoomHeatLoadResult]) -> pd.DataFrame:
+    """Überführt die Ergebnisse in eine spaltenorientierte Tabelle.
+
+    Die Transmission jedes Raums wird dabei genau einmal aufsummiert; Summen und
+    Anzeige-Tabelle werden anschließend vektorisiert aus den Spalten berechnet.
 
     Args:
         results: Liste der berechneten Heizlast-Ergebnisse
 
     Returns:
-        DataFrame mit Raum-Übersicht
+        DataFrame mit den Spalten room_name, transmission_w, ventilation_w und total_w
     """
-    data = []
-    for result in results:
-        data.append(
-            {
-                "Raum": result.room_name,
-                "Transmission [W]": f"{result.transmission_w:.0f}",
-                "Lüftung [W]": f"{result.ventilation_w:.0f}",
-                "Gesamt [W]": f"{result.total_w:.0f}",
-                "Gesamt [kW]": f"{result.total_w / 1000:.2f}",
-            }
-        )
-    return pd.DataFrame(data)
+    columns = pd.DataFrame(
+        {
+            "room_name": [r.room_name for r in results],
+            "transmission_w": [r.transmission_w for r in results],
+            "ventilation_w": [r.ventilation_w for r in results],
+        },
+    )
+    columns["total_w"] = columns["transmission_w"] + columns["ventilation_w"]
+    return columns
+
+
+def _create_rooms_dataframe(columns: pd.DataFrame) -> pd.DataFrame:
+    """Erstellt einen DataFrame mit allen Räumen und deren Heizlasten.
 
+    Args:
+        columns: Spaltenorientierte Ergebnisse aus _results_to_columns
 
-def _calculate_totals(results: list[RoomHeatLoadResult]) -> tuple[float, float, float]:
+    Returns:
+        DataFrame mit Raum-Übersicht
+    """
+    return pd.DataFrame(
+        {
+            "Raum": columns["room_name"],
+            "Transmission [W]": columns["transmission_w"].map("{:.0f}".format),
+            "Lüftung [W]": columns["ventilation_w"].map("{:.0f}".format),
+            "Gesamt [W]": columns["total_w"].map("{:.0f}".format),
+            "Gesamt [kW]": (columns["total_w"] / 1000).map("{:.2f}".format),
+        }
+    )
+
+
+def _calculate_totals(columns: pd.DataFrame) -> tuple[float, float, float]:
     """Berechnet die Gesamtsummen für Transmission, Lüftung und Heizlast.
 
     Args:
-        results: Liste der berechneten Heizlast-Ergebnisse
+        columns: Spaltenorientierte Ergebnisse aus _results_to_columns
 
     Returns:
         Tuple mit (total_transmission, total_ventilation, total_heat_load)
     """
-    total_transmission = sum(r.transmission_w for r in results)
-    total_ventilation = sum(r.ventilation_w for r in results)
-    total_heat_load = sum(r.total_w for r in results)
+    total_transmission = float(columns["transmission_w"].sum())
+    total_ventilation = float(columns["ventilation_w"].sum())
+    total_heat_load = float(columns["total_w"].sum())
     return total_transmission, total_ventilation, total_heat_load
 
 
@@ -193,8 +213,9 @@ def render_report_tab() -> None:
     results = calc_building_heat_load(building)
 
     # Erstelle DataFrame und berechne Summen
-    df = _create_rooms_dataframe(results)
-    total_transmission, total_ventilation, total_heat_load = _calculate_totals(results)
+    columns = _results_to_columns(results)
+    df = _create_rooms_dataframe(columns)
+    total_transmission, total_ventilation, total_heat_load = _calculate_totals(columns)
 
     # Render alle Sektionen
     _render_building_info(building)
@@ -1,13 +1,33 @@
 """Tab für die Räume - Refaktorierte Version mit kleineren, fokussierten Funktionen."""
 
-from typing import cast
+from dataclasses import dataclass
 
 import pandas as pd
 import streamlit as st
 
 from src.din12831.calc_heat_load import calc_room_heat_load
-from src.models import Area, ConstructionType, Element, ElementType, Room, Temperature, Ventilation, Wall
-from src.utils import get_catalog_by_type, save_building
+from src.models import (
+    Area,
+    Building,
+    Construction,
+    ConstructionType,
+    Element,
+    ElementType,
+    Room,
+    Temperature,
+    Ventilation,
+    Wall,
+)
+from src.utils import (
+    get_catalog_by_type,
+    get_catalog_by_type_and_name,
+    get_catalog_positions_by_type,
+    mark_building_dirty,
+    save_building,
+)
+
+# Auswahl im Formular für neue Öffnungen
+_OPENING_TYPE_OPTIONS = (ElementType.WINDOW, ElementType.DOOR)
 
 
 # ============================================================================
@@ -43,6 +63,38 @@ def get_wall_catalog():
     return external_walls + internal_walls
 
 
+def get_wall_catalog_by_name() -> dict[str, Construction]:
+    """Gibt alle Wandkonstruktionen (extern + intern) nach Namen zurück."""
+    return {
+        **get_catalog_by_type_and_name(ConstructionType.EXTERNAL_WALL),
+        **get_catalog_by_type_and_name(ConstructionType.INTERNAL_WALL),
+    }
+
+
+@dataclass(frozen=True)
+class RoomRenderData:
+    """Einmal pro Lauf berechnete Kennwerte eines Raums für die Anzeige."""
+
+    net_area_m2: float
+    volume_m3: float
+    gross_height_m: float
+    gross_floor_area_m2: float
+    gross_ceiling_area_m2: float
+
+
+def compute_room_render_data(room: Room, building: Building) -> RoomRenderData:
+    """Berechnet die Anzeige-Kennwerte eines Raums."""
+    net_area_m2 = room.floor_area_m2
+    gross_area_m2 = room.gross_area_m2(building) if room.floor or room.ceiling else 0.0
+    return RoomRenderData(
+        net_area_m2=net_area_m2,
+        volume_m3=net_area_m2 * room.net_height_m,
+        gross_height_m=room.gross_height_m(building),
+        gross_floor_area_m2=gross_area_m2 if room.floor else 0.0,
+        gross_ceiling_area_m2=gross_area_m2 if room.ceiling else 0.0,
+    )
+
+
 # ============================================================================
 # Render-Funktionen für Boden und Decke
 # ============================================================================
@@ -58,38 +110,32 @@ def render_adjacent_temperature_info(element: Element | None, label: str) -> str
     return ""
 
 
-def render_floor_info(room: Room) -> None:
+def render_floor_info(room: Room, data: RoomRenderData) -> None:
     """Zeigt Boden-Informationen eines Raums."""
     current_floor = room.floor.construction_name if room.floor else "Nicht zugewiesen"
     adj_temp_str = render_adjacent_temperature_info(room.floor, "Boden")
 
     st.write(f"**Boden:** {current_floor} - {adj_temp_str}")
-
-    net_area = room.floor_area_m2
-    gross_area = room.gross_floor_area_m2(st.session_state.building)
-    st.write(f"*Nettofläche:* {net_area:.2f} m² | *Bruttofläche:* {gross_area:.2f} m²")
+    st.write(f"*Nettofläche:* {data.net_area_m2:.2f} m² | *Bruttofläche:* {data.gross_floor_area_m2:.2f} m²")
 
 
-def render_ceiling_info(room: Room) -> None:
+def render_ceiling_info(room: Room, data: RoomRenderData) -> None:
     """Zeigt Decken-Informationen eines Raums."""
     current_ceiling = room.ceiling.construction_name if room.ceiling else "Nicht zugewiesen"
     adj_temp_str = render_adjacent_temperature_info(room.ceiling, "Decke")
 
     st.write(f"**Decke:** {current_ceiling} - {adj_temp_str}")
+    st.write(f"*Nettofläche:* {data.net_area_m2:.2f} m² | *Bruttofläche:* {data.gross_ceiling_area_m2:.2f} m²")
 
-    net_area = room.floor_area_m2
-    gross_area = room.gross_ceiling_area_m2(st.session_state.building)
-    st.write(f"*Nettofläche:* {net_area:.2f} m² | *Bruttofläche:* {gross_area:.2f} m²")
 
-
-def render_room_floor_ceiling_assignment(room: Room) -> None:
+def render_room_floor_ceiling_assignment(room: Room, data: RoomRenderData) -> None:
     """Zeigt Boden- und Deckenzuweisung eines Raums."""
     col1, col2 = st.columns([2, 2])
 
     with col1:
-        render_floor_info(room)
+        render_floor_info(room, data)
     with col2:
-        render_ceiling_info(room)
+        render_ceiling_info(room, data)
 
 
 # ============================================================================
@@ -118,7 +164,6 @@ def render_temperature_selector(key: str, label: str = "Raumtemperatur") -> str
 def render_construction_selector(construction_type: ConstructionType, key: str, label: str) -> str | None:
     """Zeigt einen Konstruktions-Auswahldialog."""
     options = get_catalog_by_type(construction_type)
-    options = get_catalog_by_type(construction_type)
 
     if not options:
         type_name = "Boden" if construction_type == ConstructionType.FLOOR else "Decke"
@@ -157,8 +202,12 @@ def render_floor_ceiling_selectors() -> tuple[str | None, str | None, str | None
     return floor_construction, floor_temp, ceiling_construction, ceiling_temp
 
 
-def render_area_editor(rect_id: int, rect_ids: list[int]) -> Area:
+def render_area_editor(rect_id: int, rect_ids: dict[int, None]) -> Area:
     """Zeigt Editor für ein einzelnes Rechteck."""
+    # Widget-Keys merken, damit das Zurücksetzen nicht den gesamten Session State durchsuchen muss
+    st.session_state.setdefault("new_room_rect_keys", set()).update(
+        (f"new_room_rect_{rect_id}_len", f"new_room_rect_{rect_id}_wid", f"new_room_rect_{rect_id}_del")
+    )
     cols = st.columns([2, 2, 1])
 
     with cols[0]:
@@ -182,7 +231,7 @@ def render_area_editor(rect_id: int, rect_ids: list[int]) -> Area:
     with cols[2]:
         st.write("")  # Spacer für vertikale Ausrichtung
         if len(rect_ids) > 1 and st.button("🗑️", key=f"new_room_rect_{rect_id}_del"):
-            rect_ids.remove(rect_id)
+            del rect_ids[rect_id]
             st.session_state["new_room_rect_ids"] = rect_ids
             st.rerun()
 
@@ -195,20 +244,24 @@ def render_area_editor(rect_id: int, rect_ids: list[int]) -> Area:
 def render_areas_section() -> list[Area]:
     """Zeigt die Sektion zum Bearbeiten von Rechtecken."""
     rect_ids_key = "new_room_rect_ids"
+    next_id_key = f"{rect_ids_key}_next"
     if rect_ids_key not in st.session_state:
-        st.session_state[rect_ids_key] = [1]
+        # Geordnetes dict als Menge der IDs: Löschen in O(1), Reihenfolge bleibt erhalten
+        st.session_state[rect_ids_key] = {1: None}
+        st.session_state[next_id_key] = 2
 
     st.write("**Flächen**")
     rectangles_payload: list[Area] = []
-    rect_ids: list[int] = st.session_state[rect_ids_key]
+    rect_ids: dict[int, None] = st.session_state[rect_ids_key]
 
-    for _, rect_id in enumerate(list(rect_ids), 1):
+    for rect_id in list(rect_ids):
         area = render_area_editor(rect_id, rect_ids)
         rectangles_payload.append(area)
 
     if st.button("➕ Weitere Fläche hinzufügen", key="add_new_room_rect"):
-        max_id = max(rect_ids) if rect_ids else 0
-        rect_ids.append(max_id + 1)
+        # Fortlaufender Zähler statt max() über alle IDs
+        rect_ids[st.session_state[next_id_key]] = None
+        st.session_state[next_id_key] += 1
         st.session_state[rect_ids_key] = rect_ids
         st.rerun()
 
@@ -251,57 +304,38 @@ def render_update_area_editor(room_idx: int, area: Area, area_idx: int, total_ar
 
 
 def render_update_areas_section(room: Room, room_idx: int) -> list[Area]:
-    """Zeigt die Sektion zum Bearbeiten von Flächen im Update-Formular."""
+    """Zeigt die Sektion zum Bearbeiten von Flächen im Update-Formular.
+
+    Alle Flächen werden in einer einzigen Tabelle bearbeitet; Zeilen können dort auch
+    hinzugefügt und gelöscht werden. Übernommen wird erst beim Speichern des Formulars.
+    """
     st.write("**Flächen**")
 
     if room.areas is None:
         room.areas = []
 
-    rectangles_payload: list[Area] = []
-
-    for idx, area in enumerate(room.areas):
-        cols = st.columns([2, 2, 1])
-
-        with cols[0]:
-            r_len = st.number_input(
-                "Länge (m)",
-                min_value=0.0,
-                value=area.length_m,
-                step=0.1,
-                key=f"update_room_rect_{room_idx}_{idx}_len",
-            )
-
-        with cols[1]:
-            r_wid = st.number_input(
-                "Breite (m)",
-                min_value=0.0,
-                value=area.width_m,
-                step=0.1,
-                key=f"update_room_rect_{room_idx}_{idx}_wid",
-            )
-
-        with cols[2]:
-            st.write("")  # Spacer für vertikale Ausrichtung
-            if len(room.areas) > 1:
-                delete_key = f"update_room_rect_{room_idx}_{idx}_del"
-                if st.button("🗑️", key=delete_key):
-                    room.areas.pop(idx)
-                    # Halte Expander und Update-Formular offen
-                    st.session_state[f"room_{room_idx}_expanded"] = True
-                    st.session_state[f"show_room_update_form_{room_idx}"] = True
-                    save_building(st.session_state.building)
-                    st.rerun()
-
-        rectangles_payload.append(Area(length_m=float(r_len), width_m=float(r_wid)))
-
-    if st.button("➕ Weitere Fläche hinzufügen", key=f"add_update_room_rect_{room_idx}"):
-        room.areas.append(Area(length_m=4.0, width_m=3.0))
-        # Halte Expander und Update-Formular offen
-        st.session_state[f"room_{room_idx}_expanded"] = True
-        st.session_state[f"show_room_update_form_{room_idx}"] = True
-        st.rerun()
+    areas_df = pd.DataFrame(
+        {
+            "Länge (m)": [area.length_m for area in room.areas],
+            "Breite (m)": [area.width_m for area in room.areas],
+        }
+    )
+    edited_df = st.data_editor(
+        areas_df,
+        num_rows="dynamic",
+        hide_index=True,
+        column_config={
+            "Länge (m)": st.column_config.NumberColumn(min_value=0.0, step=0.1, default=4.0, format="%.2f"),
+            "Breite (m)": st.column_config.NumberColumn(min_value=0.0, step=0.1, default=3.0, format="%.2f"),
+        },
+        key=f"update_room_areas_{room_idx}",
+    )
 
-    return rectangles_payload
+    # Leere Zellen neuer Zeilen als 0 übernehmen, damit die Validierung sie meldet
+    return [
+        Area(length_m=0.0 if pd.isna(length) else float(length), width_m=0.0 if pd.isna(width) else float(width))
+        for length, width in zip(edited_df["Länge (m)"], edited_df["Breite (m)"], strict=True)
+    ]
 
 
 def validate_new_room_inputs(
@@ -366,12 +400,11 @@ def create_new_room(
 
 def clear_new_room_form_state() -> None:
     """Löscht den Session State für das neue Raum-Formular."""
-    rect_ids_key = "new_room_rect_ids"
-    st.session_state[rect_ids_key] = [1]
+    st.session_state.pop("new_room_rect_ids", None)
+    st.session_state.pop("new_room_rect_ids_next", None)
 
-    for key in list(st.session_state.keys()):
-        if isinstance(key, str) and key.startswith("new_room_rect_"):
-            del st.session_state[key]
+    for key in st.session_state.pop("new_room_rect_keys", ()):
+        st.session_state.pop(key, None)
 
 
 def render_room_add_form() -> None:
@@ -563,17 +596,13 @@ def render_room_update_form(room: Room, room_idx: int) -> None:
             col_floor_1, col_floor_2 = st.columns(2)
 
             with col_floor_1:
-                floor_options = get_catalog_by_type(ConstructionType.FLOOR)
-                if floor_options:
-                    current_floor_idx = 0
-                    if room.floor and room.floor.construction_name:
-                        floor_names = [c.name for c in floor_options]
-                        if room.floor.construction_name in floor_names:
-                            current_floor_idx = floor_names.index(room.floor.construction_name)
+                floor_positions = get_catalog_positions_by_type(ConstructionType.FLOOR)
+                if floor_positions:
+                    current_floor_idx = floor_positions.get(room.floor.construction_name, 0) if room.floor else 0
 
                     updated_floor_construction = st.selectbox(
                         "Konstruktion",
-                        options=[c.name for c in floor_options],
+                        options=list(floor_positions),
                         index=current_floor_idx,
                         key=f"update_room_floor_construction_{room_idx}",
                         help="Aufbau des Boden",
@@ -610,17 +639,15 @@ def render_room_update_form(room: Room, room_idx: int) -> None:
             col_ceiling_1, col_ceiling_2 = st.columns(2)
 
             with col_ceiling_1:
-                ceiling_options = get_catalog_by_type(ConstructionType.CEILING)
-                if ceiling_options:
-                    current_ceiling_idx = 0
-                    if room.ceiling and room.ceiling.construction_name:
-                        ceiling_names = [c.name for c in ceiling_options]
-                        if room.ceiling.construction_name in ceiling_names:
-                            current_ceiling_idx = ceiling_names.index(room.ceiling.construction_name)
+                ceiling_positions = get_catalog_positions_by_type(ConstructionType.CEILING)
+                if ceiling_positions:
+                    current_ceiling_idx = (
+                        ceiling_positions.get(room.ceiling.construction_name, 0) if room.ceiling else 0
+                    )
 
                     updated_ceiling_construction = st.selectbox(
                         "Konstruktion",
-                        options=[c.name for c in ceiling_options],
+                        options=list(ceiling_positions),
                         index=current_ceiling_idx,
                         key=f"update_room_ceiling_construction_{room_idx}",
                         help="Aufbau des Decke",
@@ -708,10 +735,6 @@ def render_room_update_form(room: Room, room_idx: int) -> None:
                     adjacent_temperature_name=updated_ceiling_temp,
                 )
 
-            # Cleanup session state
-            if f"areas_to_delete_{room_idx}" in st.session_state:
-                del st.session_state[f"areas_to_delete_{room_idx}"]
-
             st.session_state[f"show_room_update_form_{room_idx}"] = False
             save_building(st.session_state.building)
             st.success(f"Raum '{updated_name}' wurde aktualisiert!")
@@ -749,7 +772,7 @@ def render_room_update_form(room: Room, room_idx: int) -> None:
             st.rerun()
 
 
-def render_room_info(room: Room, room_idx: int) -> None:
+def render_room_info(room: Room, room_idx: int, data: RoomRenderData) -> None:
     """Zeigt Raum-Informationen mit Bearbeiten- und Löschen-Button."""
     # Header mit Buttons
     header_cols = st.columns([10, 1])
@@ -776,8 +799,8 @@ def render_room_info(room: Room, room_idx: int) -> None:
         col1, col2 = st.columns([2, 2])
 
         with col1:
-            st.write(f"**Fläche:** {room.floor_area_m2:.2f} m²")
-            st.write(f"**Volumen:** {room.volume_m3:.2f} m³")
+            st.write(f"**Fläche:** {data.net_area_m2:.2f} m²")
+            st.write(f"**Volumen:** {data.volume_m3:.2f} m³")
             st.write(f"**Nettohöhe (Innenmaß):** {room.net_height_m:.2f} m")
 
         with col2:
@@ -785,7 +808,7 @@ def render_room_info(room: Room, room_idx: int) -> None:
             room_temp_text = format_temperature(room_temp)
             st.write(f"**Raumtemperatur:** {room_temp_text}")
             st.write(f"**Luftwechsel:** {room.ventilation.air_change_1_h} 1/h")
-            st.write(f"**Bruttohöhe (Außenmaß):** {room.gross_height_m(st.session_state.building):.2f} m")
+            st.write(f"**Bruttohöhe (Außenmaß):** {data.gross_height_m:.2f} m")
 
 
 # ============================================================================
@@ -926,7 +949,7 @@ def render_wall_update_form(room_idx: int, wall: Wall, wall_idx: int) -> None:
         st.write("**Wand bearbeiten:**")
 
         wall_options = get_wall_catalog()
-        wall_by_name = {c.name: c for c in wall_options}
+        wall_by_name = get_wall_catalog_by_name()
 
         col1, col2 = st.columns(2)
 
@@ -1045,7 +1068,7 @@ def render_wall_item(room: Room, room_idx: int, wall: Wall, wall_idx: int) -> No
                 if st.button("🗑️", key=f"delete_wall_{room_idx}_{wall_idx}"):
                     room.walls.pop(wall_idx)
                     st.session_state[f"room_{room_idx}_expanded"] = True
-                    save_building(st.session_state.building)
+                    mark_building_dirty()
                     st.rerun()
 
         # Update-Formular oder Info anzeigen
@@ -1234,7 +1257,7 @@ def validate_wall_inputs(
 def render_wall_add_form(room: Room, room_idx: int, wall_options: list) -> None:
     """Zeigt Formular zum Hinzufügen einer neuen Wand."""
     with st.container(border=True):
-        wall_by_name = {c.name: c for c in wall_options}
+        wall_by_name = get_wall_catalog_by_name()
 
         # Prüfe ob eine Innenwand ausgewählt wurde
         selected_constr_name = st.session_state.get(f"wall_constr_{room_idx}")
@@ -1353,8 +1376,8 @@ def render_opening_header_and_toggle(room_idx: int, wall_idx: int) -> bool:
 def render_window_update_form(wall: Wall, room_idx: int, wall_idx: int, win_idx: int, window: Element) -> None:
     """Zeigt Formular zum Aktualisieren eines Fensters."""
     with st.form(key=f"update_window_form_{room_idx}_{wall_idx}_{win_idx}"):
-        window_options = get_catalog_by_type(ConstructionType.WINDOW)
-        window_by_name = {w.name: w for w in window_options}
+        window_by_name = get_catalog_by_type_and_name(ConstructionType.WINDOW)
+        window_positions = get_catalog_positions_by_type(ConstructionType.WINDOW)
 
         cols = st.columns([2, 1.5, 1.5, 2])
 
@@ -1382,11 +1405,7 @@ def render_window_update_form(wall: Wall, room_idx: int, wall_idx: int, win_idx:
             )
 
         with cols[3]:
-            current_constr_idx = (
-                list(window_by_name.keys()).index(window.construction_name)
-                if window.construction_name in window_by_name
-                else 0
-            )
+            current_constr_idx = window_positions.get(window.construction_name, 0)
             updated_construction = st.selectbox(
                 "Konstruktion",
                 options=list(window_by_name.keys()),
@@ -1418,8 +1437,8 @@ def render_window_update_form(wall: Wall, room_idx: int, wall_idx: int, win_idx:
 def render_door_update_form(wall: Wall, room_idx: int, wall_idx: int, door_idx: int, door: Element) -> None:
     """Zeigt Formular zum Aktualisieren einer Tür."""
     with st.form(key=f"update_door_form_{room_idx}_{wall_idx}_{door_idx}"):
-        door_options = get_catalog_by_type(ConstructionType.DOOR)
-        door_by_name = {d.name: d for d in door_options}
+        door_by_name = get_catalog_by_type_and_name(ConstructionType.DOOR)
+        door_positions = get_catalog_positions_by_type(ConstructionType.DOOR)
 
         cols = st.columns([2, 1.5, 1.5, 2])
 
@@ -1447,9 +1466,7 @@ def render_door_update_form(wall: Wall, room_idx: int, wall_idx: int, door_idx:
             )
 
         with cols[3]:
-            current_constr_idx = (
-                list(door_by_name.keys()).index(door.construction_name) if door.construction_name in door_by_name else 0
-            )
+            current_constr_idx = door_positions.get(door.construction_name, 0)
             updated_construction = st.selectbox(
                 "Konstruktion",
                 options=list(door_by_name.keys()),
@@ -1510,7 +1527,7 @@ def render_window_list(wall: Wall, room_idx: int, wall_idx: int) -> None:
                     if st.button("🗑️", key=f"del_win_{room_idx}_{wall_idx}_{win_idx}"):
                         wall.windows.pop(win_idx)
                         st.session_state[f"room_{room_idx}_expanded"] = True
-                        save_building(st.session_state.building)
+                        mark_building_dirty()
                         st.rerun()
 
 
@@ -1544,7 +1561,7 @@ def render_door_list(wall: Wall, room_idx: int, wall_idx: int) -> None:
                     if st.button("🗑️", key=f"del_door_{room_idx}_{wall_idx}_{door_idx}"):
                         wall.doors.pop(door_idx)
                         st.session_state[f"room_{room_idx}_expanded"] = True
-                        save_building(st.session_state.building)
+                        mark_building_dirty()
                         st.rerun()
 
 
@@ -1575,14 +1592,11 @@ def render_opening_add_form(wall: Wall, room_idx: int, wall_idx: int) -> None:
         cols = st.columns([1, 2, 1.5, 1.5, 2])
 
         with cols[0]:
-            opening_type = cast(
-                ElementType,
-                st.selectbox(
-                    "Typ",
-                    options=["window", "door"],
-                    format_func=lambda x: "Fenster" if x == "window" else "Tür",
-                    key=f"opening_type_{room_idx}_{wall_idx}",
-                ),
+            opening_type: ElementType = st.selectbox(
+                "Typ",
+                options=_OPENING_TYPE_OPTIONS,
+                format_func=lambda x: "Fenster" if x == ElementType.WINDOW else "Tür",
+                key=f"opening_type_{room_idx}_{wall_idx}",
             )
 
         with cols[1]:
@@ -1691,10 +1705,13 @@ def render_room_detail(room: Room, room_idx: int) -> None:
     expander_state_key = f"room_{room_idx}_expanded"
     expanded = bool(st.session_state.get(expander_state_key, False))
 
-    with st.expander(f"📐 {room.name} ({room.volume_m3:.2f} m³)", expanded=expanded):
+    # Kennwerte einmal berechnen und an alle Teilbereiche weitergeben
+    data = compute_room_render_data(room, st.session_state.building)
+
+    with st.expander(f"📐 {room.name} ({data.volume_m3:.2f} m³)", expanded=expanded):
         render_room_heat_loads(room, room_idx)
-        render_room_info(room, room_idx)
-        render_room_floor_ceiling_assignment(room)
+        render_room_info(room, room_idx, data)
+        render_room_floor_ceiling_assignment(room, data)
         render_room_areas_editor(room, room_idx)
         render_walls_section(room, room_idx)
 
@@ -14,8 +14,7 @@ def render_temperature_add_form() -> None:
         # Reset flag prüfen und Session State leeren
         if st.session_state.get("reset_temperature_form", False):
             for key in ["temp_name", "temp_value"]:
-                if key in st.session_state:
-                    del st.session_state[key]
+                st.session_state.pop(key, None)
             st.session_state["reset_temperature_form"] = False
 
         # Eingaben in einer Zeile
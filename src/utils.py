@@ -1,15 +1,37 @@
 """Gemeinsame Hilfsfunktionen für die App."""
 
-import json
+import os
 from pathlib import Path
+from typing import Any
 
 import streamlit as st
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ist optional
+    orjson = None
+
 from src.models import Building, Construction, ConstructionType
 
 DEFAULT_BUILDING_NAME = "Mein Gebäude"
 
 
+def dump_building_json(building: Building) -> bytes:
+    """Serialisiert ein Gebäude als eingerücktes JSON, bevorzugt mit orjson.
+
+    Die Ausgabe ist byte-identisch zu ``model_dump_json(indent=2)``; orjson ist dabei spürbar schneller.
+
+    Args:
+        building: Zu serialisierendes Gebäude
+
+    Returns:
+        JSON-Inhalt als Bytes (UTF-8)
+    """
+    if orjson is not None:
+        return orjson.dumps(building.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
+    return building.model_dump_json(indent=2).encode("utf-8")
+
+
 def find_building_file() -> Path | None:
     """Sucht nach building_data*.json Dateien im Root-Verzeichnis.
 
@@ -56,28 +78,151 @@ def load_building(file_path: Path | None = None) -> Building:
         return Building(name=DEFAULT_BUILDING_NAME)
 
     try:
-        with open(file_path, encoding="utf-8") as f:
-            data = json.load(f)
-        return Building.model_validate(data)
+        raw = file_path.read_bytes()
+        # Pydantic parst und validiert direkt aus den Bytes, ohne Zwischen-Dict
+        return Building.model_validate_json(raw)
     except Exception as e:
         st.error(f"Fehler beim Laden der Daten: {e}")
         return Building(name=DEFAULT_BUILDING_NAME)
 
 
+def load_uploaded_building(uploaded_file: Any) -> Building:
+    """Lädt und validiert ein hochgeladenes Gebäude.
+
+    Args:
+        uploaded_file: Streamlit UploadedFile
+
+    Returns:
+        Validiertes Building-Objekt
+    """
+    return Building.model_validate_json(uploaded_file.getvalue())
+
+
+def _write_atomic(file_path: Path, data: bytes) -> None:
+    """Schreibt Bytes in einem Zug in eine temporäre Datei und ersetzt dann atomar das Ziel.
+
+    Bei einem Absturz bleibt so entweder die alte oder die neue Datei vollständig erhalten.
+    """
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, file_path)
+
+
 def save_building(building: Building) -> None:
     """Speichert Gebäudedaten automatisch in JSON-Datei.
 
     Der Dateiname wird basierend auf dem Gebäudenamen generiert.
     """
+    bump_building_version()
     file_path = get_building_filename(building.name)
 
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(building.model_dump(), f, indent=2, ensure_ascii=False)
+        payload = dump_building_json(building)
+
+        # Unveränderten Inhalt nicht erneut schreiben
+        fingerprint = (str(file_path.resolve()), hash(payload))
+        if st.session_state.get("_last_saved_fingerprint") == fingerprint and file_path.exists():
+            return
+
+        _write_atomic(file_path, payload)
+        st.session_state["_last_saved_fingerprint"] = fingerprint
     except Exception as e:
         st.error(f"Fehler beim Speichern: {e}")
 
 
+def get_building_version() -> int:
+    """Gibt den Änderungszähler des Gebäudes in dieser Session zurück."""
+    return st.session_state.get("building_version", 0)
+
+
+def bump_building_version() -> None:
+    """Erhöht den Änderungszähler; davon abgeleitete, gecachte Werte werden damit ungültig."""
+    st.session_state["building_version"] = get_building_version() + 1
+
+
+def mark_building_dirty() -> None:
+    """Markiert das Gebäude als geändert; gespeichert wird einmalig am Ende des Laufs."""
+    bump_building_version()
+    st.session_state["_building_dirty"] = True
+
+
+def get_building_json() -> str:
+    """Gibt das Gebäude als JSON-Text für die Debug-Ansicht zurück (gecacht pro Gebäudeversion)."""
+    version = get_building_version()
+    cached = st.session_state.get("_building_json")
+    if cached is None or cached[0] != version:
+        cached = (version, dump_building_json(st.session_state.building).decode("utf-8"))
+        st.session_state["_building_json"] = cached
+    return cached[1]
+
+
+def flush_building() -> None:
+    """Speichert das Gebäude, falls es seit dem letzten Speichern als geändert markiert wurde."""
+    if st.session_state.get("_building_dirty", False):
+        save_building(st.session_state.building)
+        st.session_state["_building_dirty"] = False
+
+
+def _build_catalog_index(catalog: list[Construction]) -> dict[ConstructionType, list[Construction]]:
+    """Gruppiert den Katalog in einem Durchlauf nach Bauteiltyp."""
+    index: dict[ConstructionType, list[Construction]] = {t: [] for t in ConstructionType}
+    for construction in catalog:
+        index[construction.element_type].append(construction)
+    return index
+
+
+def invalidate_catalog_index() -> None:
+    """Verwirft den gecachten Katalog-Index (nach Hinzufügen/Löschen von Konstruktionen)."""
+    st.session_state.pop("_catalog_index", None)
+
+
+def _get_catalog_index() -> tuple[
+    dict[ConstructionType, list[Construction]],
+    dict[ConstructionType, dict[str, Construction]],
+    dict[ConstructionType, dict[str, int]],
+]:
+    """Gibt den nach Bauteiltyp gruppierten Katalog samt Namens-Dicts zurück (gecacht pro Katalogzustand)."""
+    catalog = st.session_state.building.construction_catalog
+    cache_key = (id(catalog), len(catalog))
+
+    cached = st.session_state.get("_catalog_index")
+    if cached is None or cached[0] != cache_key:
+        by_type = _build_catalog_index(catalog)
+        by_name: dict[ConstructionType, dict[str, Construction]] = {}
+        positions: dict[ConstructionType, dict[str, int]] = {}
+        for construction_type, items in by_type.items():
+            type_by_name = {c.name: c for c in items}
+            by_name[construction_type] = type_by_name
+            positions[construction_type] = {name: i for i, name in enumerate(type_by_name)}
+        cached = (cache_key, by_type, by_name, positions)
+        st.session_state["_catalog_index"] = cached
+
+    return cached[1], cached[2], cached[3]
+
+
 def get_catalog_by_type(construction_type: ConstructionType) -> list[Construction]:
-    """Filtert den Katalog nach Bauteiltyp."""
-    return [c for c in st.session_state.building.construction_catalog if c.element_type == construction_type]
+    """Filtert den Katalog nach Bauteiltyp.
+
+    Der Index wird pro Katalog einmal aufgebaut und im Session State gehalten. Die
+    zurückgegebene Liste darf nicht verändert werden.
+    """
+    return _get_catalog_index()[0][construction_type]
+
+
+def get_catalog_positions_by_type(construction_type: ConstructionType) -> dict[str, int]:
+    """Gibt für einen Bauteiltyp die Position jedes Konstruktionsnamens zurück.
+
+    Die Schlüssel sind die (eindeutigen) Namen in Katalogreihenfolge, die Werte ihre Position
+    in dieser Reihenfolge. Geeignet als options/index für Selectboxen. Das Dict darf nicht
+    verändert werden.
+    """
+    return _get_catalog_index()[2][construction_type]
+
+
+def get_catalog_by_type_and_name(construction_type: ConstructionType) -> dict[str, Construction]:
+    """Gibt für einen Bauteiltyp die Konstruktionen nach Namen zurück.
+
+    Die Schlüssel stehen in Katalogreihenfolge und passen zu get_catalog_positions_by_type.
+    Das Dict darf nicht verändert werden.
+    """
+    return _get_catalog_index()[1][construction_type]
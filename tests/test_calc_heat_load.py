@@ -9,8 +9,10 @@ from src.din12831.calc_heat_load import (
     calc_element_transmission,
     calc_floor_ceiling_heat_load,
     calc_room_heat_load,
+    calc_transmission_heat_load,
     calc_ventilation_heat_load,
     calc_walls_heat_load,
+    compile_heat_load_sweep,
 )
 from src.models import (
     Area,
@@ -357,6 +359,14 @@ class TestCalcRoomHeatLoad:
         assert "Decke" in element_names
         assert "Nord" in element_names
 
+    def test_transmission_matches_standalone_calculation(self, sample_building, simple_room):
+        """Test dass calc_transmission_heat_load dieselbe Summe liefert."""
+        result = calc_room_heat_load(simple_room, -12.0, sample_building)
+        room_temp = sample_building.get_temperature_by_name(simple_room.room_temperature_name).value_celsius
+
+        expected = calc_transmission_heat_load(simple_room, room_temp, -12.0, sample_building)
+        assert pytest.approx(result.transmission_w) == expected
+
 
 class TestCalcBuildingHeatLoad:
     """Tests für calc_building_heat_load Funktion."""
@@ -371,3 +381,17 @@ class TestCalcBuildingHeatLoad:
         assert len(result) == 1
         assert result[0].room_name == "Wohnzimmer"
         assert result[0].total_w > 0
+
+
+class TestCompileHeatLoadSweep:
+    """Tests für compile_heat_load_sweep Funktion."""
+
+    def test_matches_full_calculation(self, sample_building, simple_room):
+        """Test dass die Auswertung der vollständigen Berechnung entspricht."""
+        sample_building.rooms = [simple_room]
+        sweep = compile_heat_load_sweep(sample_building)
+
+        assert sweep.room_names == ["Wohnzimmer"]
+        for outside_temperatur in (-16.0, -12.0, 0.0, 5.5):
+            expected = calc_room_heat_load(simple_room, outside_temperatur, sample_building).total_w
+            assert sweep.evaluate(outside_temperatur) == [pytest.approx(expected)]
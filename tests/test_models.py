@@ -577,6 +577,8 @@ class TestRoom:
         # Bruttofläche = 20.0 + 4.0014 = 24.0014 m²
         gross_floor = room.gross_floor_area_m2(building)
         assert gross_floor == pytest.approx(24.0014)
+        # Boden und Decke teilen sich die Brutto-Grundfläche
+        assert room.gross_area_m2(building) == gross_floor
 
     def test_room_gross_ceiling_area(self):
         """Test Room.gross_ceiling_area_m2() calculation mit wandbasierter Berechnung."""
@@ -747,6 +749,54 @@ class TestBuilding:
         with pytest.raises(ValueError, match="Construction name cannot be None"):
             building.get_construction_by_name(None)
 
+    def test_building_lookup_follows_catalog_changes(self):
+        """Name lookups stay correct after appending, removing and renaming catalog entries."""
+        building = Building(name="Test Building", temperature_catalog=[Temperature(name="Innen", value_celsius=20.0)])
+        assert building.get_temperature_by_name("Innen").value_celsius == 20.0
+
+        building.temperature_catalog.append(Temperature(name="Außen", value_celsius=-12.0))
+        assert building.get_temperature_by_name("Außen").value_celsius == -12.0
+
+        building.temperature_catalog[0].name = "Wohnraum"
+        assert building.get_temperature_by_name("Wohnraum").value_celsius == 20.0
+        with pytest.raises(ValueError, match="not found"):
+            building.get_temperature_by_name("Innen")
+
+        building.temperature_catalog.pop()
+        with pytest.raises(ValueError, match="not found"):
+            building.get_temperature_by_name("Außen")
+
+    def test_building_lookup_follows_replaced_entries(self):
+        """Replacing an entry in place (same catalog length) must not return the old object."""
+        building = Building(
+            name="Test Building",
+            construction_catalog=[
+                Construction(name="A", u_value_w_m2k=1.0, thickness_m=0.3),
+                Construction(name="B", u_value_w_m2k=2.0, thickness_m=0.3),
+            ],
+        )
+        assert building.get_construction_by_name("B").u_value_w_m2k == 2.0
+
+        building.construction_catalog[1] = Construction(name="B", u_value_w_m2k=3.0, thickness_m=0.3)
+        assert building.get_construction_by_name("B").u_value_w_m2k == 3.0
+
+        building.construction_catalog.pop(0)
+        building.construction_catalog.append(Construction(name="A", u_value_w_m2k=9.0, thickness_m=0.3))
+        assert building.get_construction_by_name("A").u_value_w_m2k == 9.0
+        assert building.get_construction_by_name("B").u_value_w_m2k == 3.0
+
+    def test_building_lookup_returns_first_duplicate(self):
+        first = Construction(name="Wall", u_value_w_m2k=0.2, thickness_m=0.3)
+        second = Construction(name="Wall", u_value_w_m2k=0.5, thickness_m=0.3)
+        building = Building(name="Test Building", construction_catalog=[first, second])
+        assert building.get_construction_by_name("Wall") is first
+
+    def test_building_equality_ignores_lookup_cache(self):
+        catalog = [Temperature(name="Innen", value_celsius=20.0)]
+        used = Building(name="Test Building", temperature_catalog=catalog)
+        used.get_temperature_by_name("Innen")
+        assert used == Building(name="Test Building", temperature_catalog=catalog)
+
     def test_building_outside_temperature_property(self):
         temp_outside = Temperature(name="Outside", value_celsius=-10.0)
         building = Building(
@@ -783,6 +833,16 @@ class TestBuilding:
         with pytest.raises(ValidationError):
             Building(name="Bad Building", thermal_bridge_surcharge=-0.05)
 
+    def test_building_keeps_nested_instances(self):
+        """Validated nested models are taken over by reference, not copied."""
+        room = Room(name="Living Room", areas=[Area(length_m=5.0, width_m=4.0)], net_height_m=2.5)
+        construction = Construction(name="Window", element_type=ConstructionType.WINDOW, u_value_w_m2k=1.2)
+        building = Building.model_validate(
+            {"name": "Test Building", "rooms": [room], "construction_catalog": [construction]}
+        )
+        assert building.rooms[0] is room
+        assert building.construction_catalog[0] is construction
+
 
 class TestIntegration:
     """Integration tests for complex scenarios."""
@@ -0,0 +1,152 @@
+"""Tests für utils Modul."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+import streamlit as st
+
+from src.din12831.calc_heat_load import calc_building_heat_load
+from src.models import Building, ConstructionType, ElementType
+from src.utils import (
+    _build_catalog_index,
+    dump_building_json,
+    get_catalog_by_type_and_name,
+    get_catalog_positions_by_type,
+    load_building,
+    load_uploaded_building,
+    save_building,
+)
+
+DEMO_FILE = Path(__file__).parent.parent / "building_data_Demo.json"
+
+
+@pytest.fixture(autouse=True)
+def clear_session_state():
+    """Leert den Session State vor und nach jedem Test (Gebäude, Katalog-Index, Versionszähler)."""
+    st.session_state.clear()
+    yield
+    st.session_state.clear()
+
+
+@pytest.fixture
+def demo_building() -> Building:
+    """Lädt das Demo-Gebäude mit voller Validierung."""
+    return Building.model_validate_json(DEMO_FILE.read_text(encoding="utf-8"))
+
+
+class TestLoadBuilding:
+    """Tests für load_building Funktion."""
+
+    def test_missing_file_returns_default(self, tmp_path):
+        building = load_building(tmp_path / "does_not_exist.json")
+        assert building.name == "Mein Gebäude"
+        assert building.rooms == []
+
+    def test_reload_matches_validated(self, demo_building):
+        building = load_building(DEMO_FILE)
+        assert building == demo_building
+
+    def test_reload_restores_enums(self):
+        building = load_building(DEMO_FILE)
+        assert all(isinstance(c.element_type, ConstructionType) for c in building.construction_catalog)
+        assert all(isinstance(r.floor.type, ElementType) for r in building.rooms if r.floor)
+
+    def test_reload_fills_defaults(self, tmp_path, demo_building):
+        data = demo_building.model_dump(mode="json")
+        del data["construction_catalog"][0]["element_type"]
+        file_path = tmp_path / "building.json"
+        file_path.write_text(json.dumps(data), encoding="utf-8")
+
+        assert load_building(file_path) == Building.model_validate(data)
+
+    def test_hand_edited_file_is_validated(self, tmp_path, demo_building):
+        data = demo_building.model_dump(mode="json")
+        # Zahl als Text wird konvertiert, ein unbekannter Bauteiltyp abgelehnt
+        data["construction_catalog"][0]["u_value_w_m2k"] = "0.25"
+        file_path = tmp_path / "building.json"
+        file_path.write_text(json.dumps(data), encoding="utf-8")
+        assert load_building(file_path).construction_catalog[0].u_value_w_m2k == 0.25
+
+        data["construction_catalog"][0]["element_type"] = "unknown"
+        file_path.write_text(json.dumps(data), encoding="utf-8")
+        assert load_building(file_path).name == "Mein Gebäude"
+
+    def test_uploaded_building_is_validated(self, demo_building):
+        uploaded = io.BytesIO(DEMO_FILE.read_bytes())
+        assert load_uploaded_building(uploaded) == demo_building
+
+    def test_reload_heat_load(self, demo_building):
+        expected = [r.total_w for r in calc_building_heat_load(demo_building)]
+        actual = [r.total_w for r in calc_building_heat_load(load_building(DEMO_FILE))]
+        assert actual == pytest.approx(expected)
+
+
+class TestSaveBuilding:
+    """Tests für save_building Funktion."""
+
+    def test_roundtrip(self, tmp_path, monkeypatch, demo_building):
+        monkeypatch.chdir(tmp_path)
+        save_building(demo_building)
+
+        saved_file = tmp_path / "building_data_Demo.json"
+        assert saved_file.exists()
+        assert load_building(saved_file) == demo_building
+
+    def test_non_canonical_upload_is_saved_canonically(self, tmp_path, monkeypatch, demo_building):
+        monkeypatch.chdir(tmp_path)
+        data = demo_building.model_dump(mode="json")
+        # Vorgabewert weggelassen und Zahl als Text: Pydantic ergänzt bzw. konvertiert beim Validieren
+        del data["construction_catalog"][0]["element_type"]
+        data["construction_catalog"][1]["u_value_w_m2k"] = str(data["construction_catalog"][1]["u_value_w_m2k"])
+        raw = json.dumps(data).encode("utf-8")
+        uploaded = Building.model_validate_json(raw)
+
+        save_building(uploaded)
+
+        reloaded = load_building(tmp_path / "building_data_Demo.json")
+        assert reloaded == uploaded
+        calc_building_heat_load(reloaded)
+
+    def test_unchanged_building_is_not_rewritten(self, tmp_path, monkeypatch, demo_building):
+        monkeypatch.chdir(tmp_path)
+        save_building(demo_building)
+        saved_file = tmp_path / "building_data_Demo.json"
+        saved_file.write_text("sentinel", encoding="utf-8")
+
+        # Gleicher Inhalt: kein erneutes Schreiben
+        save_building(demo_building)
+        assert saved_file.read_text(encoding="utf-8") == "sentinel"
+
+        # Geänderter Inhalt wird geschrieben
+        demo_building.thermal_bridge_surcharge = 0.1
+        save_building(demo_building)
+        assert load_building(saved_file).thermal_bridge_surcharge == 0.1
+
+    def test_dump_matches_pydantic_json(self, demo_building):
+        assert dump_building_json(demo_building) == demo_building.model_dump_json(indent=2).encode("utf-8")
+
+
+class TestBuildCatalogIndex:
+    """Tests für die Gruppierung des Bauteilkatalogs."""
+
+    def test_groups_by_type_in_catalog_order(self, demo_building):
+        catalog = demo_building.construction_catalog
+        index = _build_catalog_index(catalog)
+
+        assert set(index) == set(ConstructionType)
+        for construction_type, constructions in index.items():
+            assert constructions == [c for c in catalog if c.element_type == construction_type]
+
+    def test_empty_catalog_has_all_types(self):
+        index = _build_catalog_index([])
+        assert all(index[t] == [] for t in ConstructionType)
+
+    def test_names_and_positions_match_selectbox_options(self, demo_building):
+        st.session_state.building = demo_building
+        for construction_type in ConstructionType:
+            by_name = get_catalog_by_type_and_name(construction_type)
+            positions = get_catalog_positions_by_type(construction_type)
+            assert list(by_name) == list(positions)
+            assert all(list(by_name).index(name) == i for name, i in positions.items())